@@ -4,11 +4,15 @@ Generate FFmpeg overlay commands for emojis
 Reads ASS file and creates overlay filter for each emoji
 """
 
+import os
 import sys
 import re
 import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, TypedDict
+from typing import List, Dict, Tuple, TypedDict
 
 class EmojiData(TypedDict):
     """Type definition for emoji data structure"""
@@ -17,55 +21,116 @@ class EmojiData(TypedDict):
     end: str
     text: str
 
-def parse_ass_file(ass_file: str) -> List[EmojiData]:
-    """Parse ASS file and extract emoji positions and timings."""
+# Emoji patterns, compiled once at import time. Actual emoji codepoints are
+# matched with a single flat character class (covers emoticons, pictographs,
+# transport, flags, dingbats and enclosed symbols) \u2014 far cheaper for the
+# regex engine than a multi-branch alternation. Escaped sequences like
+# \u1234, \U00012345 or surrogate pairs \ud83d\udc4d are handled by a
+# second pattern that only runs when a backslash escape is present.
+_EMOJI_UNICODE_RE = re.compile(
+    r"[\U0001F300-\U0001FAFF\U00002700-\U000027BF\U000024C2-\U0001F251]+"
+)
+_EMOJI_ESCAPE_RE = re.compile(
+    r"(?:\\u[0-9a-fA-F]{4}|\\U[0-9a-fA-F]{8}|\\ud[89a-fA-F][0-9a-fA-F]{2})+"
+)
+
+# Escape-sequence expansion for emoji strings pulled from the ASS text.
+# Surrogate pairs (👍) must be combined into a single codepoint;
+# remaining \uXXXX / \UXXXXXXXX escapes map straight through chr()
+_SURROGATE_PAIR_RE = re.compile(
+    r'\\u[dD][89abAB][0-9a-fA-F]{2}\\u[dD][c-fC-F][0-9a-fA-F]{2}'
+)
+_ESC_RE = re.compile(r'\\U[0-9a-fA-F]{8}|\\u[0-9a-fA-F]{4}')
+
+def _expand_escapes(emoji: str) -> str:
+    """Expand backslash escape sequences to the actual emoji characters."""
+    emoji = _SURROGATE_PAIR_RE.sub(
+        lambda m: chr(0x10000
+                      + ((int(m.group(0)[2:6], 16) - 0xD800) << 10)
+                      + (int(m.group(0)[8:12], 16) - 0xDC00)),
+        emoji
+    )
+    return _ESC_RE.sub(
+        # Leave lone surrogate halves as literal text: chr() would produce
+        # an unencodable character
+        lambda m: m.group(0) if 0xD800 <= int(m.group(0)[2:], 16) <= 0xDFFF
+        else chr(int(m.group(0)[2:], 16)),
+        emoji
+    )
+
+# Matches a Dialogue line, capturing start time, end time and text in one
+# pass; non-Dialogue lines are rejected by the regex engine in C
+_DIALOGUE_RE = re.compile(
+    r'^Dialogue:\s*[^,]*,(?P<start>[^,]+),(?P<end>[^,]+),(?:[^,]*,){6}(?P<text>.*)$'
+)
+
+# Minimum number of dialogue lines before the thread pool pays for itself
+_PARALLEL_THRESHOLD = 1000
+
+def _extract_emojis(dialogues: List[Tuple[str, str, str]]) -> List[EmojiData]:
+    """Run the emoji regexes over (start, end, text) dialogue tuples."""
     emojis_data: List[EmojiData] = []
-    
+
+    for start_time, end_time, text in dialogues:
+        emojis: List[str] = _EMOJI_UNICODE_RE.findall(text)
+        # Cheap substring prefilter: most dialogue lines contain no escapes
+        if '\\u' in text or '\\U' in text:
+            emojis += _EMOJI_ESCAPE_RE.findall(text)
+
+        for emoji in emojis:
+            emojis_data.append({
+                'emoji': emoji,
+                'start': start_time,
+                'end': end_time,
+                'text': text
+            })
+
+    return emojis_data
+
+def parse_ass_file(ass_file: str) -> List[EmojiData]:
+    """Parse ASS file and extract emoji positions and timings.
+
+    Streams the file line by line so memory stays O(1) regardless of
+    subtitle file size. Very large files spread the emoji regex search
+    across a thread pool, one contiguous chunk per worker.
+    """
+    dialogues: List[Tuple[str, str, str]] = []
+    in_events = False
+
     with open(ass_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Extract events
-    events_section = content.split('[Events]')[1] if '[Events]' in content else ""
-    
-    for line in events_section.split('\n'):
-        if line.startswith('Dialogue:'):
-            parts = line.split(',', 9)
-            if len(parts) < 10:
+        for line in f:
+            if not in_events:
+                if line.startswith('[Events]'):
+                    in_events = True
                 continue
-            
-            start_time = parts[1]  # Format: 0:00:00.00
-            end_time = parts[2]
-            text = parts[9]
-            
-            # Find emojis in text (Unicode range for emojis AND escaped sequences)
-            emoji_pattern = re.compile(
-                r"("
-                r"[\U0001F600-\U0001F64F]"  # emoticons
-                r"|[\U0001F300-\U0001F5FF]"  # symbols & pictographs
-                r"|[\U0001F680-\U0001F6FF]"  # transport & map symbols
-                r"|[\U0001F1E0-\U0001F1FF]"  # flags
-                r"|[\U00002702-\U000027B0]"
-                r"|[\U000024C2-\U0001F251]"
-                r"|\\u[0-9a-fA-F]{4}"  # escaped Unicode sequences like \u1234
-                r"|\\U[0-9a-fA-F]{8}"  # escaped Unicode sequences like \U00012345
-                r"|\\ud[89a-fA-F][0-9a-fA-F]{2}"  # surrogate pairs like \ud83d\udc4d
-                r")+", flags=re.UNICODE
-            )
-            
-            emojis: List[str] = emoji_pattern.findall(text)
-            
-            for emoji in emojis:
-                emojis_data.append({
-                    'emoji': emoji,
-                    'start': start_time,
-                    'end': end_time,
-                    'text': text
-                })
-    
-    return emojis_data
 
+            match = _DIALOGUE_RE.match(line)
+            if match is None:
+                continue
+
+            # Groups: start (format 0:00:00.00), end, text
+            dialogues.append((match.group('start'), match.group('end'), match.group('text')))
+
+    workers = os.cpu_count() or 1
+    if workers == 1 or len(dialogues) < _PARALLEL_THRESHOLD:
+        return _extract_emojis(dialogues)
+
+    chunk_size = -(-len(dialogues) // workers)  # ceil division
+    chunks = [dialogues[i:i + chunk_size] for i in range(0, len(dialogues), chunk_size)]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # Contiguous chunks + ordered map keep the result order identical
+        # to a serial pass
+        return [data for part in pool.map(_extract_emojis, chunks) for data in part]
+
+@lru_cache(maxsize=None)
 def time_to_seconds(time_str: str) -> float:
-    """Convert ASS time format (0:00:00.00) to seconds."""
+    """Convert ASS time format (0:00:00.00) to seconds.
+
+    Memoized: an ASS file has a finite set of distinct timestamps and each
+    one is parsed twice per emoji (start + end), so repeat hits skip the
+    split/int/float parsing entirely.
+    """
     parts = time_str.split(':')
     hours = int(parts[0])
     minutes = int(parts[1])
@@ -75,7 +140,7 @@ def time_to_seconds(time_str: str) -> float:
 def generate_overlay_filter(emojis_data: List[EmojiData], emoji_images_dir: str = "emoji_images") -> str:
     """
     Generate FFmpeg overlay filter for all emojis.
-    
+
     Returns complex filter string for FFmpeg.
     """
     # Load emoji map
@@ -83,44 +148,61 @@ def generate_overlay_filter(emojis_data: List[EmojiData], emoji_images_dir: str
     if not map_file.exists():
         print(f"Error: {map_file} not found. Run emoji_to_image.py first!")
         return ""
-    
+
     with open(map_file, 'r', encoding='utf-8') as f:
         emoji_map: Dict[str, str] = json.load(f)
-    
-    # Build overlay filter
-    overlays: List[str] = []
-    
-    for i, data in enumerate(emojis_data):
+
+    # Resolve each instance to its image and timing, grouping instances by
+    # image so ffmpeg loads every PNG once no matter how often it appears
+    instances: List[tuple] = []  # (image_path, start_sec, end_sec)
+    groups: Dict[str, List[int]] = defaultdict(list)
+
+    for data in emojis_data:
         emoji: str = data['emoji']
-        
-        # Convert escaped Unicode sequences back to actual emojis
-        try:
-            # Handle \u and \U sequences
-            emoji = emoji.encode().decode('unicode-escape')
-        except (UnicodeDecodeError, UnicodeEncodeError):
-            # If decoding fails, use the original emoji
-            pass
-        
+
+        # Convert escaped Unicode sequences back to actual emojis; the
+        # common case (no escapes) skips the regex passes entirely
+        if '\\' in emoji:
+            emoji = _expand_escapes(emoji)
+
         if emoji not in emoji_map:
             print(f"Warning: Emoji '{emoji}' not found in emoji map")
             continue
-        
+
         image_path = emoji_map[emoji]
-        start_sec = time_to_seconds(data['start'])
-        end_sec = time_to_seconds(data['end'])
-        
-        # Position: right side of text, centered vertically
-        # x=W/2+100, y=H/2 (center of screen, offset to right)
-        overlay = f"movie={image_path}:loop=0,setpts=PTS-STARTPTS+{start_sec}/TB[emoji{i}];"
-        overlay += f"[v{i}][emoji{i}]overlay=x=W/2+100:y=H/2:enable='between(t,{start_sec},{end_sec})'[v{i+1}]"
-        
-        overlays.append(overlay)
-    
-    if not overlays:
+        groups[image_path].append(len(instances))
+        instances.append((image_path, time_to_seconds(data['start']), time_to_seconds(data['end'])))
+
+    if not instances:
         return ""
-    
-    # Combine all overlays
-    filter_complex = ";".join(overlays)
+
+    # One movie= source per unique image; split it when the image is shown
+    # in several intervals so each interval gets its own branch
+    sources: List[str] = []
+    labels: Dict[int, str] = {}  # instance index -> source stream label
+
+    for k, (image_path, idxs) in enumerate(groups.items()):
+        if len(idxs) == 1:
+            sources.append(f"movie={image_path}:loop=0[em{k}_0]")
+            labels[idxs[0]] = f"em{k}_0"
+        else:
+            branches = ''.join(f"[em{k}_{j}]" for j in range(len(idxs)))
+            sources.append(f"movie={image_path}:loop=0[em{k}];[em{k}]split={len(idxs)}{branches}")
+            for j, idx in enumerate(idxs):
+                labels[idx] = f"em{k}_{j}"
+
+    # Position: right side of text, centered vertically
+    # x=W/2+100, y=H/2 (center of screen, offset to right)
+    overlays: List[str] = []
+
+    for i, (_, start_sec, end_sec) in enumerate(instances):
+        label = labels[i]
+        overlay = f"[{label}]setpts=PTS-STARTPTS+{start_sec}/TB[{label}d];"
+        overlay += f"[v{i}][{label}d]overlay=x=W/2+100:y=H/2:enable='between(t,{start_sec},{end_sec})'[v{i+1}]"
+        overlays.append(overlay)
+
+    # Combine sources and overlay chain
+    filter_complex = ";".join(sources + overlays)
     return filter_complex
 
 if __name__ == "__main__":
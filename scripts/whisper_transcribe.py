@@ -4,9 +4,11 @@ AI-Enhanced Whisper Transcription Engine for TikTok Clip Studio
 """
 
 import sys
+import re
 import logging
-from typing import Dict, List, Optional
-from collections import defaultdict
+from typing import Dict, List, Optional, Sequence
+from collections import deque
+from itertools import cycle
 from pathlib import Path
 from dataclasses import dataclass, field
 from enum import Enum
@@ -32,6 +34,51 @@ SUPPORTED_MODELS = ["tiny", "base", "small", "medium", "large", "large-v2", "lar
 MAX_WORD_LENGTH = 100
 MIN_CONFIDENCE_THRESHOLD = 0.3
 
+# Pop-in animation override tag prepended to every word (and its emoji)
+_ANIM_POP = "{\\t(0, 150, \\fscx125\\fscy125)}"
+
+# Strips punctuation and whitespace from a word in one C-level pass
+_PUNCT_TRANS = str.maketrans('', '', '.,!?;: \t\r\n')
+
+# ASS header, preformatted once at import time. The style lines share
+# everything but name, font size, primary colour, outline and shadow, so
+# they are generated from one template instead of nine near-identical
+# literals.
+_STYLE_LINE = (
+    "Style: %s,Luckiest Guy,%d,%s,&H000000FF,&H00000000,&H80000000,"
+    "-1,0,0,0,100,100,0,0,1,%d,%d,5,10,10,0,1\n"
+)
+_STYLES = (
+    # (name, fontsize, primary colour, outline, shadow)
+    ("Color1", 100, "&H0000FFFF", 6, 3),
+    ("Color2", 100, "&H00FF00FF", 6, 3),
+    ("Color3", 100, "&H00FFFF00", 6, 3),
+    ("Color4", 100, "&H0000FF00", 6, 3),
+    ("Color5", 100, "&H00FF8000", 6, 3),
+    ("Color6", 100, "&H00FFFFFF", 6, 3),
+    ("Emphasis", 110, "&H0000FF00", 7, 4),
+    ("Celebration", 105, "&H00FF00FF", 6, 3),
+    ("Energetic", 102, "&H0000FFFF", 6, 3),
+)
+_ASS_HEADER = (
+    "[Script Info]\n"
+    "Title: TikTok Captions\n"
+    "ScriptType: v4.00+\n"
+    "WrapStyle: 0\n"
+    "PlayResX: 1080\n"
+    "PlayResY: 1920\n"
+    "\n"
+    "[V4+ Styles]\n"
+    "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, "
+    "OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, "
+    "ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, "
+    "MarginL, MarginR, MarginV, Encoding\n"
+    + ''.join(_STYLE_LINE % style for style in _STYLES)
+    + "\n"
+    "[Events]\n"
+    "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n"
+)
+
 class Sentiment(Enum):
     """Enumeration of supported sentiment types."""
     POSITIVE = "positive"
@@ -40,6 +87,11 @@ class Sentiment(Enum):
     NEUTRAL = "neutral"
 
 
+# Sentiment value -> ordinal, for counting sentiments in a flat list
+# instead of a dict
+_SENT_IDX = {sentiment.value: i for i, sentiment in enumerate(Sentiment)}
+
+
 @dataclass
 class TranscriptionStats:
     """Statistics for a transcription session."""
@@ -53,20 +105,20 @@ class TranscriptionStats:
 
 def format_timestamp_srt(seconds: float) -> str:
     """Convert seconds to SRT timestamp format."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds % 1) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+    whole = int(seconds)
+    millis = int((seconds - whole) * 1000)
+    minutes, secs = divmod(whole, 60)
+    hours, minutes = divmod(minutes, 60)
+    return "%02d:%02d:%02d,%03d" % (hours, minutes, secs, millis)
 
 
 def format_timestamp_ass(seconds: float) -> str:
     """Convert seconds to ASS timestamp format."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    centisecs = int((seconds % 1) * 100)
-    return f"{hours}:{minutes:02d}:{secs:02d}.{centisecs:02d}"
+    whole = int(seconds)
+    centisecs = int((seconds - whole) * 100)
+    minutes, secs = divmod(whole, 60)
+    hours, minutes = divmod(minutes, 60)
+    return "%d:%02d:%02d.%02d" % (hours, minutes, secs, centisecs)
 
 
 class AIEnhancer:
@@ -74,31 +126,38 @@ class AIEnhancer:
     
     def __init__(self):
         # Filler/stop words
-        self.filler_words = {
+        self.filler_words = frozenset({
             "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
             "le", "la", "les", "un", "une", "des", "de", "du", "et", "ou", "mais",
             # ... (rest of your filler words remain the same)
-        }
+        })
         
         # Sentiment lexicons
-        self.positive_words = {
+        self.positive_words = frozenset({
             "love", "happy", "great", "amazing", "awesome", "perfect", "best",
             "amour", "aimer", "heureux", "heureuse", "génial", "géniale", "super",
             # ... (rest of your positive words remain the same)
-        }
+        })
         
-        self.negative_words = {
+        self.negative_words = frozenset({
             "hate", "sad", "bad", "terrible", "awful", "worst", "horrible",
             "détester", "triste", "mauvais", "mauvaise", "terrible", "horrible",
             # ... (rest of your negative words remain the same)
-        }
+        })
         
-        self.energetic_words = {
+        self.energetic_words = frozenset({
             "fire", "lit", "hot", "crazy", "wild", "insane", "explosive",
             "feu", "chaud", "chaude", "fou", "folle", "dingue", "sauvage",
             # ... (rest of your energetic words remain the same)
-        }
-        
+        })
+
+        # Combined sentiment lookup: word -> category index (0=positive,
+        # 1=negative, 2=energetic). One dict probe per word instead of
+        # three separate set membership tests.
+        self._sentiment_lut: Dict[str, int] = {w: 0 for w in self.positive_words}
+        self._sentiment_lut.update({w: 1 for w in self.negative_words})
+        self._sentiment_lut.update({w: 2 for w in self.energetic_words})
+
         # Emoji categories
         self.emoji_categories: Dict[str, Dict[str, str]] = {
             "emotions_positive": {
@@ -115,12 +174,39 @@ class AIEnhancer:
             self.emoji_map.update(emojis)
         
         # Emphasis words
-        self.emphasis_words = {
+        self.emphasis_words = frozenset({
             "important", "never", "always", "must", "need", "critical",
             "important", "jamais", "toujours", "doit", "besoin", "critique",
             # ... (rest of your emphasis words remain the same)
-        }
+        })
         
+        # Words whose contextual emoji depends on the preceding words; the
+        # context path short-circuits in O(1) for everything else
+        self._ctx_triggers = frozenset({"fire", "hot", "you", "it", "this"})
+
+        # Pattern-based emoji rules, precompiled into one alternation regex
+        # per category. A single C-level search() per category replaces the
+        # Python-level any(pattern in word ...) substring scans; rule order
+        # matches the original checks so the first hit still wins.
+        _pattern_emoji_rules = (
+            (("ing", "ed", "run", "jump", "move", "work", "er", "ant", "ent",
+              "courir", "sauter", "bouger", "travailler"), "💨"),
+            (("achiev", "success", "complet", "finish", "accomplish",
+              "réussir", "succès", "terminer", "accomplir"), "🏆"),
+            (("learn", "know", "understand", "study", "teach",
+              "apprendre", "savoir", "comprendre", "étudier", "enseigner"), "💡"),
+            (("friend", "family", "people", "person", "team",
+              "ami", "amis", "famille", "gens", "personne", "équipe"), "👥"),
+            (("today", "tomorrow", "yesterday", "time", "moment",
+              "aujourd'hui", "demain", "hier", "temps", "moment"), "⏰"),
+            (("why", "how", "what", "question", "wonder",
+              "pourquoi", "comment", "quoi", "question"), "🤔"),
+        )
+        self._pattern_emojis = [
+            (re.compile('|'.join(map(re.escape, fragments))), emoji)
+            for fragments, emoji in _pattern_emoji_rules
+        ]
+
         # Color schemes
         self.color_schemes = {
             "positive": "&H0000FFFF",
@@ -137,11 +223,14 @@ class AIEnhancer:
             return Sentiment.NEUTRAL.value
             
         words_lower = [w.lower().strip('.,!?;:') for w in words_list if w]
-        
-        positive_count = sum(1 for w in words_lower if w in self.positive_words)
-        negative_count = sum(1 for w in words_lower if w in self.negative_words)
-        energetic_count = sum(1 for w in words_lower if w in self.energetic_words)
-        
+
+        counts = [0, 0, 0]
+        for w in words_lower:
+            category = self._sentiment_lut.get(w)
+            if category is not None:
+                counts[category] += 1
+        positive_count, negative_count, energetic_count = counts
+
         if energetic_count >= 1:
             return Sentiment.ENERGETIC.value
         elif positive_count > negative_count and positive_count >= 1:
@@ -183,39 +272,32 @@ class AIEnhancer:
             return "💭"
 
         # Pattern matching for various word categories
-        if any(pattern in word for pattern in ["ing", "ed", "run", "jump", "move", "work", "er", "ant", "ent", "courir", "sauter", "bouger", "travailler"]):
-            return "💨"
-
-        if any(pattern in word for pattern in ["achiev", "success", "complet", "finish", "accomplish", "réussir", "succès", "terminer", "accomplir"]):
-            return "🏆"
-
-        if any(pattern in word for pattern in ["learn", "know", "understand", "study", "teach", "apprendre", "savoir", "comprendre", "étudier", "enseigner"]):
-            return "💡"
-
-        if any(pattern in word for pattern in ["friend", "family", "people", "person", "team", "ami", "amis", "famille", "gens", "personne", "équipe"]):
-            return "👥"
-
-        if any(pattern in word for pattern in ["today", "tomorrow", "yesterday", "time", "moment", "aujourd'hui", "demain", "hier", "temps", "moment"]):
-            return "⏰"
-
-        if any(pattern in word for pattern in ["why", "how", "what", "question", "wonder", "pourquoi", "comment", "quoi", "question"]):
-            return "🤔"
+        for pattern, emoji in self._pattern_emojis:
+            if pattern.search(word):
+                return emoji
 
         return "✨"
     
-    def get_contextual_emoji(self, word: str, prev_words: Optional[List[str]] = None, 
-                            next_words: Optional[List[str]] = None) -> Optional[str]:
-        """Get emoji with context awareness."""
+    def get_contextual_emoji(self, word: str, prev_words: Optional[Sequence[str]] = None,
+                            next_words: Optional[Sequence[str]] = None) -> Optional[str]:
+        """Get emoji with context awareness.
+
+        prev_words is expected to hold already-lowered words; non-trigger
+        words bail out before the context string is ever built.
+        """
         if word in self.emoji_map:
             return self.emoji_map[word]
-        
+
+        if word not in self._ctx_triggers:
+            return None
+
         if prev_words:
-            prev_text = ' '.join(prev_words).lower()
+            prev_text = ' '.join(prev_words)
             if "on fire" in prev_text and word in ["fire", "hot"]:
                 return "🔥"
             if "love" in prev_text and word in ["you", "it", "this"]:
                 return "❤️"
-        
+
         return None
     
     def should_emphasize(self, word: str) -> bool:
@@ -227,23 +309,17 @@ class AIEnhancer:
         return self.color_schemes.get(sentiment, self.color_schemes["neutral"])
 
 
-def transcribe_to_srt(audio_path: str, output_path: str, model_size: str = DEFAULT_MODEL_SIZE) -> str:
-    """Main transcription function with AI enhancements."""
-    if not Path(audio_path).exists():
-        raise FileNotFoundError(f"Audio file not found: {audio_path}")
-    
+def _load_model(model_size: str = DEFAULT_MODEL_SIZE) -> "WhisperModel":
+    """Load the Whisper model once; callers may reuse it across clips."""
     if model_size not in SUPPORTED_MODELS:
         logger.warning(f"Model '{model_size}' not in supported list. Proceeding anyway...")
-    
+
     logger.info(f"🤖 Initializing AI-Enhanced Whisper model: {model_size}...")
-    print(f"🤖 Initializing AI-Enhanced Whisper model: {model_size}...", file=sys.stderr)
-        
-    ai = AIEnhancer()
-        
+
     try:
         model = WhisperModel(
-            model_size, 
-            device="cpu", 
+            model_size,
+            device="cpu",
             compute_type="int8",
             cpu_threads=0
         )
@@ -251,8 +327,16 @@ def transcribe_to_srt(audio_path: str, output_path: str, model_size: str = DEFAU
     except Exception as e:
         logger.error(f"Failed to load Whisper model: {e}")
         raise RuntimeError(f"Model initialization failed: {e}")
-        
-    print(f"Transcribing: {audio_path}...", file=sys.stderr)
+
+    return model
+
+
+def _transcribe_with(model: "WhisperModel", ai: AIEnhancer, audio_path: str, output_path: str) -> str:
+    """Transcribe one clip with an already-loaded model and enhancer."""
+    if not Path(audio_path).exists():
+        raise FileNotFoundError(f"Audio file not found: {audio_path}")
+
+    logger.info(f"Transcribing: {audio_path}...")
         
     try:
         segments, info = model.transcribe(  # type: ignore
@@ -267,7 +351,6 @@ def transcribe_to_srt(audio_path: str, output_path: str, model_size: str = DEFAU
         raise RuntimeError(f"Transcription error: {e}")
         
     logger.info(f"Detected language: {info.language} (probability: {info.language_probability:.2f})")
-    print(f"Detected language: {info.language} (probability: {info.language_probability:.2f})", file=sys.stderr)
         
     stats = TranscriptionStats(
         language=info.language,
@@ -278,40 +361,16 @@ def transcribe_to_srt(audio_path: str, output_path: str, model_size: str = DEFAU
         
     try:
         with open(ass_output, 'w', encoding='utf-8') as f:
-            # ASS Header
-            f.write("[Script Info]\n")
-            f.write("Title: TikTok Captions\n")
-            f.write("ScriptType: v4.00+\n")
-            f.write("WrapStyle: 0\n")
-            f.write("PlayResX: 1080\n")
-            f.write("PlayResY: 1920\n")
-            f.write("\n")
-                
-            # Styles
-            f.write("[V4+ Styles]\n")
-            f.write("Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding\n")
-                
-            f.write("Style: Color1,Luckiest Guy,100,&H0000FFFF,&H000000FF,&H00000000,&H80000000,-1,0,0,0,100,100,0,0,1,6,3,5,10,10,0,1\n")
-            f.write("Style: Color2,Luckiest Guy,100,&H00FF00FF,&H000000FF,&H00000000,&H80000000,-1,0,0,0,100,100,0,0,1,6,3,5,10,10,0,1\n")
-            f.write("Style: Color3,Luckiest Guy,100,&H00FFFF00,&H000000FF,&H00000000,&H80000000,-1,0,0,0,100,100,0,0,1,6,3,5,10,10,0,1\n")
-            f.write("Style: Color4,Luckiest Guy,100,&H0000FF00,&H000000FF,&H00000000,&H80000000,-1,0,0,0,100,100,0,0,1,6,3,5,10,10,0,1\n")
-            f.write("Style: Color5,Luckiest Guy,100,&H00FF8000,&H000000FF,&H00000000,&H80000000,-1,0,0,0,100,100,0,0,1,6,3,5,10,10,0,1\n")
-            f.write("Style: Color6,Luckiest Guy,100,&H00FFFFFF,&H000000FF,&H00000000,&H80000000,-1,0,0,0,100,100,0,0,1,6,3,5,10,10,0,1\n")
-
-            f.write("Style: Emphasis,Luckiest Guy,110,&H0000FF00,&H000000FF,&H00000000,&H80000000,-1,0,0,0,100,100,0,0,1,7,4,5,10,10,0,1\n")
-            f.write("Style: Celebration,Luckiest Guy,105,&H00FF00FF,&H000000FF,&H00000000,&H80000000,-1,0,0,0,100,100,0,0,1,6,3,5,10,10,0,1\n")
-            f.write("Style: Energetic,Luckiest Guy,102,&H0000FFFF,&H000000FF,&H00000000,&H80000000,-1,0,0,0,100,100,0,0,1,6,3,5,10,10,0,1\n")
-            f.write("\n")
-                
-            # Events
-            f.write("[Events]\n")
-            f.write("Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n")
-                
-            word_count = 0
+            # ASS header, styles and events preamble in one write
+            f.write(_ASS_HEADER)
+
             total_words = 0
             emoji_count = 0
             important_word_count = 0
-            sentiment_stats: defaultdict[str, int] = defaultdict(int)
+            sentiment_counts = [0] * len(Sentiment)
+            dialogue_lines: List[str] = []
+            color_iter = cycle(("Color1", "Color2", "Color3", "Color4", "Color5", "Color6"))
+            prev_words: deque = deque(maxlen=3)  # rolling lowered-word context
                 
             segments_list = list(segments)
                 
@@ -319,63 +378,86 @@ def transcribe_to_srt(audio_path: str, output_path: str, model_size: str = DEFAU
                 if hasattr(segment, 'words') and segment.words:
                     total_words += len(segment.words)
                     
-            print(f"🎯 Processing {total_words} words with AI enhancements...", file=sys.stderr)
+            logger.info(f"🎯 Processing {total_words} words with AI enhancements...")
                 
             for segment in segments_list:
                 if hasattr(segment, 'words') and segment.words:
                     segment_words = [w.word for w in segment.words]
                     segment_sentiment = ai.analyze_sentiment(segment_words)
-                    sentiment_stats[segment_sentiment] += 1
-                        
-                    for word in segment.words:
+                    sentiment_counts[_SENT_IDX[segment_sentiment]] += 1
+
+                    # Normalize the whole segment up front with C-level list
+                    # comprehensions instead of re-deriving the cleaned and
+                    # lowered forms word by word. translate strips whitespace
+                    # and punctuation in a single pass, and the lowered form
+                    # reuses the already-stripped string.
+                    cleaned_words = [w.translate(_PUNCT_TRANS) for w in segment_words]
+                    lowered_words = [w.lower() for w in cleaned_words]
+
+                    for word, word_clean, word_lower in zip(segment.words, cleaned_words, lowered_words):
                         start_time = format_timestamp_ass(word.start)
                         end_time = format_timestamp_ass(word.end)
-                            
-                        word_clean = word.word.strip()
-                        word_lower = word_clean.lower().strip('.,!?;:')
+
                         text_raw = word_clean.upper()
 
-                        animation_pop = "\\t(0, 150, \\fscx125\\fscy125)"
-                        text = f"{{{animation_pop}}}{text_raw}"
+                        parts = [_ANIM_POP, text_raw]
 
-                        emoji = ai.get_contextual_emoji(word_lower, None, None)
+                        # Only trigger words and direct map hits can yield a
+                        # contextual emoji, so skip the call for the rest
+                        if word_lower in ai.emoji_map or word_lower in ai._ctx_triggers:
+                            emoji = ai.get_contextual_emoji(word_lower, prev_words)
+                        else:
+                            emoji = None
+                        prev_words.append(word_lower)
 
                         if not emoji and ai.is_important_word(word_lower):
                             emoji = ai.assign_smart_emoji(word_lower, segment_sentiment)
                             important_word_count += 1
 
                         if emoji:
-                            animation_emoji = "\\t(0, 150, \\fscx125\\fscy125)"
-                            text += f" {{{animation_emoji}}} {emoji}"
+                            parts.extend((' ', _ANIM_POP, ' ', emoji))
                             emoji_count += 1
 
-                        color_styles = ["Color1", "Color2", "Color3", "Color4", "Color5", "Color6"]
-                        style = color_styles[word_count % 6]
+                        style = next(color_iter)
 
                         if ai.should_emphasize(word_lower):
                             style = "Emphasis"
-                            text = f"✨ {text} ✨"
+                            parts.insert(0, '✨ ')
+                            parts.append(' ✨')
                         elif word_lower in ["party", "celebrate", "congrats", "congratulations", "birthday",
                                           "fête", "fêter", "célébrer", "anniversaire", "félicitations"]:
                             style = "Celebration"
                         elif word_lower in ai.energetic_words:
                             style = "Energetic"
 
-                        f.write(f"Dialogue: 0,{start_time},{end_time},{style},,0,0,0,,{text}\n")
-                        word_count += 1
-                        
+                        text = ''.join(parts)
+                        dialogue_lines.append(f"Dialogue: 0,{start_time},{end_time},{style},,0,0,0,,{text}\n")
+
+            word_count = len(dialogue_lines)
+
+            # One buffered write for all dialogue lines instead of one
+            # f.write call per word
+            f.writelines(dialogue_lines)
+
             stats.total_words = word_count
             stats.emoji_count = emoji_count
             stats.ai_assigned_emojis = important_word_count
+            # Only sentiments that actually occurred, as before
+            sentiment_stats = {
+                sentiment: count
+                for sentiment, count in zip(_SENT_IDX, sentiment_counts) if count
+            }
             stats.sentiment_distribution = dict(sentiment_stats)
                 
-            logger.info("AI processing complete")
-            print(f"✓ AI processing complete:", file=sys.stderr)
-            print(f"  • {word_count} words processed", file=sys.stderr)
-            print(f"  • {emoji_count} emojis added ({important_word_count} AI-assigned to important words)", file=sys.stderr)
-            print(f"  • Sentiment distribution:", file=sys.stderr)
-            for sentiment, count in sentiment_stats.items():
-                print(f"    - {sentiment}: {count} segments", file=sys.stderr)
+            summary = [
+                "✓ AI processing complete:",
+                f"  • {word_count} words processed",
+                f"  • {emoji_count} emojis added ({important_word_count} AI-assigned to important words)",
+                "  • Sentiment distribution:",
+            ]
+            summary.extend(f"    - {sentiment}: {count} segments"
+                           for sentiment, count in sentiment_stats.items())
+            logger.info('\n'.join(summary))
                 
     except IOError as e:
         logger.error(f"Failed to write subtitle file: {e}")
@@ -383,20 +465,64 @@ def transcribe_to_srt(audio_path: str, output_path: str, model_size: str = DEFAU
         
     logger.info(f"Transcription saved to: {ass_output}")
     logger.info(f"Generated {word_count} word-level subtitles")
-    print(f"✓ Transcription saved to: {ass_output}", file=sys.stderr)
-    print(f"✓ Generated {word_count} word-level subtitles", file=sys.stderr)
         
     return ass_output
 
 
+def transcribe_to_srt(audio_path: str, output_path: str, model_size: str = DEFAULT_MODEL_SIZE) -> str:
+    """Main transcription function with AI enhancements."""
+    if not Path(audio_path).exists():
+        raise FileNotFoundError(f"Audio file not found: {audio_path}")
+
+    model = _load_model(model_size)
+    return _transcribe_with(model, AIEnhancer(), audio_path, output_path)
+
+
+def run_daemon(model_size: str = DEFAULT_MODEL_SIZE) -> None:
+    """Serve transcription requests from stdin with one warm model.
+
+    Each request is a line of the form 'audio_path<TAB>output_path'; the
+    resulting subtitle path is echoed on stdout. Model weights are loaded
+    once and reused, so per-clip latency drops to transcription time only.
+    """
+    model = _load_model(model_size)
+    ai = AIEnhancer()
+    logger.info("Daemon ready, waiting for 'audio\\toutput' lines on stdin")
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            audio_path, output_path = line.split('\t', 1)
+        except ValueError:
+            logger.error(f"Malformed request (expected 'audio\\toutput'): {line}")
+            print("ERROR\tmalformed request", flush=True)
+            continue
+
+        try:
+            result = _transcribe_with(model, ai, audio_path, output_path)
+            print(result, flush=True)
+        except Exception as e:
+            logger.error(f"Transcription failed for {audio_path}: {e}")
+            print(f"ERROR\t{e}", flush=True)
+
+
 def main():
     """Main entry point for the transcription service."""
     logger.info(f"AI-Enhanced Whisper Transcription Engine v{VERSION}")
-        
+
+    if '--daemon' in sys.argv:
+        args = [a for a in sys.argv[1:] if a != '--daemon']
+        run_daemon(args[0] if args else DEFAULT_MODEL_SIZE)
+        sys.exit(0)
+
     if len(sys.argv) < 3:
         print(f"AI-Enhanced Whisper Transcription Engine v{VERSION}", file=sys.stderr)
         print("\nUsage:", file=sys.stderr)
-        print("  python3 whisper_transcribe.py <audio_file> <output_srt> [model_size]\n", file=sys.stderr)
+        print("  python3 whisper_transcribe.py <audio_file> <output_srt> [model_size]", file=sys.stderr)
+        print("  python3 whisper_transcribe.py --daemon [model_size]\n", file=sys.stderr)
         print("Arguments:", file=sys.stderr)
         print("  audio_file   Path to input audio file (WAV, MP3, etc.)", file=sys.stderr)
         print("  output_srt   Path for output subtitle file (.srt extension)", file=sys.stderr)
@@ -416,19 +542,15 @@ def main():
         sys.exit(0)
     except FileNotFoundError as e:
         logger.error(f"File not found: {e}")
-        print(f"ERROR: {e}", file=sys.stderr)
         sys.exit(2)
     except ValueError as e:
         logger.error(f"Invalid input: {e}")
-        print(f"ERROR: {e}", file=sys.stderr)
         sys.exit(3)
     except RuntimeError as e:
         logger.error(f"Runtime error: {e}")
-        print(f"ERROR: {e}", file=sys.stderr)
         sys.exit(4)
     except Exception as e:
         logger.exception("Unexpected error occurred")
-        print(f"FATAL ERROR: {e}", file=sys.stderr)
         sys.exit(5)
 
 
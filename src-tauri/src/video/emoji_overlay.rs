@@ -87,12 +87,19 @@ pub async fn convert_with_emoji_overlays(
         )
     };
 
+    // Pass the graph via -filter_complex_script: emoji-heavy clips produce
+    // multi-kilobyte graphs that would otherwise travel through argv
+    let script_file = subtitle_file.replace(".ass", "_filtergraph.ffscript");
+    tokio::fs::write(&script_file, &filter_complex)
+        .await
+        .map_err(|e| format!("Failed to write filtergraph script: {e}"))?;
+
     let args = vec![
         "-y",
         "-i",
         input,
-        "-filter_complex",
-        &filter_complex,
+        "-filter_complex_script",
+        &script_file,
         "-map",
         "[vN]", // Use final video output from filter chain
         "-c:v",